@@ -1,4 +1,7 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 # python3 -m app.exiftool-gui "/home/sheldon/Downloads/20170812 Edward Dye 340.jpg"
 __VERSION__ = "0.0.10"
@@ -10,14 +13,45 @@ from pathlib import Path
 
 from PyQt6.QtGui import QIcon
 
-# Set Fallback Theme
-QIcon.setFallbackSearchPaths([str(Path(__file__).parent / "resources" / "icon_theme")])
-
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - '
-                              '%(module)s:[%(funcName)s]:%(lineno)s - %(message)s')
-ch = logging.StreamHandler()
-ch.setLevel(logging.DEBUG)
-ch.setFormatter(formatter)
-logger = logging.getLogger(__APP_NAME__)
-logger.addHandler(ch)
-logger.setLevel(logging.DEBUG)
+_ICON_THEME_PATH = str(Path(__file__).parent / "resources" / "icon_theme")
+
+
+def configure_icon_theme():
+    """
+    Sets up the fallback icon theme. Call this once the QApplication has been created
+    """
+    QIcon.setFallbackSearchPaths([_ICON_THEME_PATH])
+
+
+# The formatter does not use thread or process details, so skip collecting them for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+def setup_logger(name: str, level=logging.DEBUG) -> logging.Logger:
+    """
+    Creates a logger for the application. Records are handed to a background listener, so logging never blocks
+    the UI thread on I/O. A logger that was already set up is returned as is
+    :param name: The name of the logger
+    :param level: The initial log level
+    :return: The configured logger
+    """
+    _logger = logging.getLogger(name)
+    if _logger.handlers:
+        return _logger
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - '
+                                  '%(module)s:[%(funcName)s]:%(lineno)s - %(message)s')
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.DEBUG)
+    ch.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, ch, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    _logger.addHandler(QueueHandler(log_queue))
+    _logger.setLevel(level)
+    return _logger
+
+
+logger = setup_logger(__APP_NAME__)
@@ -1,9 +1,10 @@
 import logging
+import os
+from collections import deque
 from enum import StrEnum
-from functools import partial
 
-from PyQt6.QtCore import pyqtSignal, Qt
-from PyQt6.QtGui import QIcon, QActionGroup, QContextMenuEvent
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt
+from PyQt6.QtGui import QAction, QActionGroup, QContextMenuEvent
 from PyQt6.QtWidgets import QMenuBar, QMenu, QCheckBox
 
 import app
@@ -19,27 +20,42 @@ def _find_action(text, actions):
     :param text: action text to search for
     :return:
     """
-    # TODO: Test
-    q = list(actions)
+    q = deque(actions)
     while len(q) > 0:
-        action = q.pop(0)
+        action = q.popleft()
         if action.isSeparator():
             continue
         if action.text() == text:
             return action
-        if action.menu() is not None:
-            q.extend(action.menu().actions())
+        sub_menu = action.menu()
+        if sub_menu is not None:
+            q.extend(sub_menu.actions())
 
 
-def _clear_menu(_menu: QMenu | QActionGroup):
+def _clear_menu(_menu: QMenu):
     """
-    Removes all entries from a menu
+    Removes all entries from a menu, deleting the actions that the menu owns
     Args:
         _menu: The menu to clear
 
     """
-    for action in list(_menu.actions()):
-        _menu.removeAction(action)
+    _menu.clear()
+
+
+def _replace_menu_actions(_menu: QMenu, actions: list):
+    """
+    Replaces all entries of a menu in one batch, the menu is not repainted until all the actions are added
+    Args:
+        _menu: The menu to update
+        actions: The new entries of the menu
+
+    """
+    _menu.setUpdatesEnabled(False)
+    try:
+        _menu.clear()
+        _menu.addActions(actions)
+    finally:
+        _menu.setUpdatesEnabled(True)
 
 
 class MediaLibAction(StrEnum):
@@ -82,17 +98,18 @@ class ViewContextMenu(QMenu, HasCollectionDisplaySupport):
     _PROP_SOURCE = "source"
 
     def show_collection(self, collection: Collection):
-        # Now Build the new menus
+        self._hidden_tags = set()
+        self._group_by = {}
+        self._tag_checkboxes = {}
+        # Now Build the new menus, the field selections are only built when their menu is opened
         self._update_presets_menu(collection)
-        self._show_field_selection(collection.tags, self._vm_columns, True, ViewContextMenuAction.COLUMN)
-        self._show_field_selection(collection.tags, self._vm_groupby, False, ViewContextMenuAction.GROUP_BY)
+        self._pending_field_menus = {self._vm_columns: (collection.tags, ViewContextMenuAction.COLUMN),
+                                     self._vm_groupby: (collection.tags, ViewContextMenuAction.GROUP_BY)}
         self._vm_presets.setEnabled(True)
         self._vm_columns.setEnabled(True)
         self._vm_groupby.setEnabled(True)
-        self._hidden_tags = set()
         self._all_tags = collection.tags
-        self._group_by = []
-        self._tag_checkboxes = {}
+        self._shown_columns = None
 
     def shut_collection(self):
         self._vm_presets.setEnabled(False)
@@ -101,8 +118,10 @@ class ViewContextMenu(QMenu, HasCollectionDisplaySupport):
         self._view_fs.setChecked(False)
         self._hidden_tags = set()
         self._all_tags = []
-        self._group_by = []
+        self._shown_columns = None
+        self._group_by = {}
         self._tag_checkboxes = {}
+        self._pending_field_menus = {}
 
     def show_menu(self, cm_args: QContextMenuEvent, file_ops: bool, file_exists: bool):
         self._open.setVisible(file_ops)
@@ -116,56 +135,115 @@ class ViewContextMenu(QMenu, HasCollectionDisplaySupport):
         self.exec(cm_args.globalPos())
 
     def set_available_fields(self, available_fields: list):
+        # The view shows all the available fields, so the next column change has to be raised
         self._all_tags = available_fields
+        self._shown_columns = None
 
     def is_fs_view_requested(self):
         return self._view_fs.isEnabled() and self._view_fs.isChecked()
 
-    def _show_field_selection(self, fields: list, reference_menu: QMenu, items_enabled: bool, event_source: ViewContextMenuAction):
-        reference_menu.clear()
-        groups = apputils.create_tag_groups(fields)
-        if props.DB_TAG_GROUP_DEFAULT in groups:
-            for key in groups[props.DB_TAG_GROUP_DEFAULT]:
-                cb = self._create_checkbox(key, reference_menu, key, event_source, checked=items_enabled)
-                self._add_menu_item(reference_menu, cb)
-            reference_menu.addSeparator()
-            del groups[props.DB_TAG_GROUP_DEFAULT]
-
-        for group, items in sorted(groups.items()):
+    def _show_field_selection(self, fields: list, reference_menu: QMenu, event_source: ViewContextMenuAction):
+        # Group menus are children of the reference menu, clear() only removes their entries
+        for action in reference_menu.actions():
+            if action.menu() is not None:
+                action.menu().deleteLater()
+        default_fields, groups = self._get_field_groups(fields)
+        actions = []
+        if len(default_fields) > 0:
+            for key in default_fields:
+                cb = self._create_checkbox(key, reference_menu, key, event_source,
+                                           checked=self._is_field_checked(key, event_source))
+                actions.append(self._create_menu_item(reference_menu, cb))
+            separator = QAction(reference_menu)
+            separator.setSeparator(True)
+            actions.append(separator)
+
+        # The checkboxes of a group are only created when its menu is opened
+        for group, items in groups:
             group_menu = QMenu(group, parent=reference_menu)
-            for key in sorted(items):
-                field_name = f"{group}:{key}"
-                cb = self._create_checkbox(key, reference_menu, field_name, event_source, checked=items_enabled)
-                self._add_menu_item(group_menu, cb)
-            reference_menu.addMenu(group_menu)
+            group_menu.setProperty(self._PROP_FIELD_ID, items)
+            group_menu.setProperty(self._PROP_SOURCE, event_source)
+            group_menu.aboutToShow.connect(self._populate_group_menu)
+            actions.append(group_menu.menuAction())
+        _replace_menu_actions(reference_menu, actions)
+
+    def _get_field_groups(self, fields: list):
+        # The columns and group-by menus are built from the same fields, so they are only grouped once
+        fields_key = tuple(fields)
+        if fields_key != self._field_groups_key:
+            groups = apputils.create_tag_groups(fields)
+            default_fields = groups.pop(props.DB_TAG_GROUP_DEFAULT, [])
+            self._field_groups = (default_fields, list(groups.items()))
+            self._field_groups_key = fields_key
+        return self._field_groups
+
+    def _is_field_checked(self, field_name: str, source: ViewContextMenuAction):
+        # Presets and group-by changes may have been made before a field's checkbox is created
+        if source == ViewContextMenuAction.COLUMN:
+            return field_name not in self._hidden_tags
+        return field_name in self._group_by
+
+    @pyqtSlot()
+    def _populate_field_menu(self):
+        reference_menu = self.sender()
+        if reference_menu not in self._pending_field_menus:
+            return
+        fields, source = self._pending_field_menus.pop(reference_menu)
+        self._show_field_selection(fields, reference_menu, source)
+
+    @pyqtSlot()
+    def _populate_group_menu(self):
+        group_menu = self.sender()
+        if not group_menu.isEmpty():
+            return
+        group = group_menu.title()
+        source = group_menu.property(self._PROP_SOURCE)
+        actions = []
+        for key in group_menu.property(self._PROP_FIELD_ID):
+            field_name = f"{group}:{key}"
+            cb = self._create_checkbox(key, group_menu, field_name, source,
+                                       checked=self._is_field_checked(field_name, source))
+            actions.append(self._create_menu_item(group_menu, cb))
+        _replace_menu_actions(group_menu, actions)
 
     def __init__(self, parent):
         super().__init__("&View", parent=parent)
-        self._combo_stylesheet = f"padding: {self.fontMetrics().horizontalAdvance('  ')}px; text-align:left;"
         self._hidden_tags = set()
         self._all_tags = []
-        self._group_by = []
+        self._shown_columns = None
+        # Used as an ordered set, the fields are grouped in the order they were selected
+        self._group_by = {}
         self._tag_checkboxes = {}
+        self._field_groups_key = None
+        self._field_groups = ([], [])
+        self._pending_field_menus = {}
         self._vm_columns = QMenu("Columns", self)
-        self._vm_columns.setIcon(QIcon.fromTheme("view-file-columns"))
+        self._vm_columns.setIcon(apputils.get_themed_icon("view-file-columns"))
         self._vm_presets = QMenu("Preset Views", self)
-        self._vm_presets.setIcon(QIcon.fromTheme("document-save"))
+        self._vm_presets.setIcon(apputils.get_themed_icon("document-save"))
         self._vm_groupby = QMenu("Group By", self)
-        self._vm_groupby.setIcon(QIcon.fromTheme("view-list-tree"))
+        self._vm_groupby.setIcon(apputils.get_themed_icon("view-list-tree"))
+        # The checkboxes are styled by their menus, so the stylesheet is only parsed once per menu
+        combo_stylesheet = f"QCheckBox {{padding: {self.fontMetrics().horizontalAdvance('  ')}px; text-align:left;}}"
+        self._vm_columns.setStyleSheet(combo_stylesheet)
+        self._vm_groupby.setStyleSheet(combo_stylesheet)
+        self._vm_columns.aboutToShow.connect(self._populate_field_menu)
+        self._vm_groupby.aboutToShow.connect(self._populate_field_menu)
         self._presets_group = QActionGroup(self._vm_presets)
         self._presets_group.setExclusive(True)
         self._open = apputils.create_action(self, ViewContextMenuAction.OPEN, icon="document-open",
-                                            tooltip="Open in default application",
-                                            func=self._raise_view_event, enabled=False)
+                                            tooltip="Open in default application", enabled=False)
         self._explore = apputils.create_action(self, ViewContextMenuAction.EXPLORE, icon="system-file-manager",
-                                               tooltip="Open in shell explorer",
-                                               func=self._raise_view_event, enabled=False)
+                                               tooltip="Open in shell explorer", enabled=False)
         self._view_fs = apputils.create_action(self, ViewContextMenuAction.FS_VIEW, icon="view-list-tree",
-                                               tooltip="View results in file hierarchy",
-                                               func=self._raise_view_event, enabled=False, checked=False)
+                                               tooltip="View results in file hierarchy", enabled=False,
+                                               checked=False)
         self._export = apputils.create_action(self, ViewContextMenuAction.EXPORT, icon="document-export",
-                                              tooltip="Export data to file",
-                                              func=self._raise_view_event, enabled=True)
+                                              tooltip="Export data to file", enabled=True)
+
+        # Each menu reports its own entries through a single slot
+        self.triggered.connect(self._raise_view_event)
+        self._vm_presets.triggered.connect(self._preset_clicked_event)
 
         self._init_default_menu()
 
@@ -183,77 +261,92 @@ class ViewContextMenu(QMenu, HasCollectionDisplaySupport):
     def _create_checkbox(self, text, parent, field_name, source, checked=False):
         cb = QCheckBox(text, parent)
         cb.setToolTip(f"Show/Hide {text} in the view")
-        cb.setStyleSheet(self._combo_stylesheet)
-        cb.clicked.connect(partial(self._checkbox_click_event, cb))
+        cb.clicked.connect(self._checkbox_click_event)
         cb.setProperty(self._PROP_FIELD_ID, field_name)
         cb.setProperty(self._PROP_SOURCE, source)
         cb.setChecked(checked)
-        self._tag_checkboxes[field_name] = cb
+        # Presets only change the visible columns
+        if source == ViewContextMenuAction.COLUMN:
+            self._tag_checkboxes[field_name] = cb
         return cb
 
     def _update_presets_menu(self, db: Collection):
         self._vm_presets.clear()
-        self._create_preset("Basic Fields", "Show basic file information", props.get_basic_fields(), db)
-        self._create_preset("Image Fields", "Show image file information", props.get_image_fields(), db)
-        self._create_preset("All Fields", "Show all available file information", set(self._all_tags), db)
+        collection_tags = set(db.tags)
+        self._create_preset("Basic Fields", "Show basic file information", props.get_basic_fields(), collection_tags)
+        self._create_preset("Image Fields", "Show image file information", props.get_image_fields(), collection_tags)
+        self._create_preset("All Fields", "Show all available file information", set(self._all_tags), collection_tags)
 
-    def _create_preset(self, name: str, tooltip: str, fields: set, collection: Collection):
+    def _create_preset(self, name: str, tooltip: str, fields: set, collection_tags: set):
         # Remove fields from the presets that are not in this collection
-        filtered_fields = [f for f in fields if f in collection.tags]
+        filtered_fields = frozenset(fields & collection_tags)
         if len(filtered_fields) > 0:
-            action = apputils.create_action(self._vm_presets, name, self._preset_clicked_event, tooltip=tooltip,
-                                            checked=False)
+            action = apputils.create_action(self._vm_presets, name, tooltip=tooltip, checked=False)
             action.setProperty(self._PROP_FIELD_ID, filtered_fields)
             self._vm_presets.addAction(action)
             self._presets_group.addAction(action)
         else:
-            app.logger.debug(f"{name} will not be shown as none of the fields are in this collection")
+            app.logger.debug("%s will not be shown as none of the fields are in this collection", name)
 
-    def _raise_view_event(self, event):
-        self.view_event.emit(event, None)
+    @pyqtSlot(QAction)
+    def _raise_view_event(self, action: QAction):
+        # Presets are also reported here, they are handled by _preset_clicked_event
+        if isinstance(action.data(), ViewContextMenuAction):
+            self.view_event.emit(action.data(), None)
 
-    def _preset_clicked_event(self, preset_name):
-        menu_item = _find_action(preset_name, self._vm_presets.actions())
-        fields = menu_item.property(self._PROP_FIELD_ID)
+    @pyqtSlot(QAction)
+    def _preset_clicked_event(self, action: QAction):
+        fields = action.property(self._PROP_FIELD_ID)
         if fields is not None:
-            self._hidden_tags.clear()
-            for f in self._all_tags:
-                if f not in fields:
-                    self._hidden_tags.add(f)
-                    self._tag_checkboxes[f].setChecked(False)
-                else:
-                    self._tag_checkboxes[f].setChecked(True)
+            previously_hidden = self._hidden_tags
+            self._hidden_tags = {f for f in self._all_tags if f not in fields}
+            # The checkboxes mirror the hidden tags, so only the fields that changed visibility need updating.
+            # Checkboxes that were not created yet will pick up their state when their menu is opened
+            for field_id in previously_hidden ^ self._hidden_tags:
+                cb = self._tag_checkboxes.get(field_id)
+                if cb is not None:
+                    cb.setChecked(field_id not in self._hidden_tags)
 
             # raise the event
             self._raise_field_change_event()
 
-    def _checkbox_click_event(self, field):
+    def _raise_field_change_event(self):
+        # Re-selecting a preset would otherwise rebuild the view with the columns it already shows
+        columns = [f for f in self._all_tags if f not in self._hidden_tags]
+        if columns == self._shown_columns:
+            app.logger.debug("Columns are unchanged, the view will not be updated")
+            return
+        self._shown_columns = columns
+        self.view_event.emit(ViewContextMenuAction.COLUMN, columns)
+
+    @pyqtSlot(bool)
+    def _checkbox_click_event(self, checked: bool):
+        # Only user clicks are handled here, checkboxes updated by presets do not emit clicked
+        field = self.sender()
         field_id = field.property(self._PROP_FIELD_ID)
         source = field.property(self._PROP_SOURCE)
 
         match source:
             case ViewContextMenuAction.GROUP_BY:
-                if field.isChecked():
-                    logging.debug(f"{field_id} was added to group-by by user.")
-                    self._group_by.append(field_id)
+                if checked:
+                    app.logger.debug("%s was added to group-by by user.", field_id)
+                    self._group_by[field_id] = None
                 else:
-                    logging.debug(f"{field_id} was removed from group-by by user.")
-                    self._group_by.remove(field_id)
-                self.view_event.emit(ViewContextMenuAction.GROUP_BY, self._group_by)
+                    app.logger.debug("%s was removed from group-by by user.", field_id)
+                    self._group_by.pop(field_id, None)
+                self.view_event.emit(ViewContextMenuAction.GROUP_BY, list(self._group_by))
             case ViewContextMenuAction.COLUMN:
-                if field.isChecked():
-                    logging.debug(f"{field_id} was checked by user.")
-                    self._hidden_tags.remove(field_id)
+                if checked:
+                    app.logger.debug("%s was checked by user.", field_id)
+                    self._hidden_tags.discard(field_id)
                 else:
-                    logging.debug(f"{field_id} was un-checked by user.")
+                    app.logger.debug("%s was un-checked by user.", field_id)
                     self._hidden_tags.add(field_id)
-                self.view_event.emit(ViewContextMenuAction.COLUMN, [f for f in self._all_tags if f not in self._hidden_tags])
+                self._raise_field_change_event()
 
     @staticmethod
-    def _add_menu_item(parent: QMenu, widget):
-        _action = apputils.create_action(parent, "", tooltip=widget.toolTip(), widget=widget)
-        _action.setDefaultWidget(widget)
-        parent.addAction(_action)
+    def _create_menu_item(parent: QMenu, widget):
+        return apputils.create_widget_action(parent, widget, tooltip=widget.toolTip())
 
 
 class CollectionMenu(QMenu, HasCollectionDisplaySupport):
@@ -262,46 +355,47 @@ class CollectionMenu(QMenu, HasCollectionDisplaySupport):
     _MENU_DB_PATHS = "Collection Paths"
     _MENU_DB_HISTORY = "Recently Opened"
     _MENU_DB_BOOKMARKS = "Favorites"
+    # The first nine collection paths can be toggled from the keyboard
+    _PATH_SHORTCUTS = tuple(f"Ctrl+{i}" for i in range(1, 10))
+
+    _COLLECTION_ACTIONS = (DBAction.SAVE, DBAction.SAVE_AS, DBAction.SHUT_DB, DBAction.REFRESH,
+                           DBAction.REFRESH_SELECTED, DBAction.REINDEX_COLLECTION, DBAction.RESET, DBAction.BOOKMARK)
+    # You can only save to an existing collection. Default collections need to be 'saved as'
+    _ENABLED_ON_SHOW = {
+        DBType.ON_DISK: {a: True for a in _COLLECTION_ACTIONS},
+        DBType.IN_MEMORY: {a: a not in (DBAction.SAVE, DBAction.RESET, DBAction.BOOKMARK) for a in _COLLECTION_ACTIONS},
+    }
 
     def show_collection(self, collection: Collection):
-        # You can only save to an existing collection. Default collections need to be 'saved as'
-        self._save.setEnabled(not collection.type == DBType.IN_MEMORY)
-        self._reset.setEnabled(not collection.type == DBType.IN_MEMORY)
-        self._add_bookmark.setEnabled(not (collection.type == DBType.IN_MEMORY or collection.is_private))
-        self._save_as.setEnabled(True)
-        self._refresh.setEnabled(True)
-        self._reindex.setEnabled(True)
-        self._selective_refresh.setEnabled(True)
-        self._shut_db.setEnabled(True)
+        for db_action, enabled in self._ENABLED_ON_SHOW[collection.type].items():
+            self._collection_actions[db_action].setEnabled(enabled)
+        if collection.is_private:
+            self._add_bookmark.setEnabled(False)
         self._paths_menu.setEnabled(True)
 
-        _clear_menu(self._paths_menu)
-        for count, item in enumerate(collection.paths):
-            self._paths_menu.addAction(apputils.create_action(self, item, func=self._paths_change_event,
-                                                              icon=apputils.get_mime_type_icon_name(item),
-                                                              shortcut=f"Ctrl+{count + 1}" if count < 9 else None,
-                                                              checked=True)
-                                       )
+        self._path_actions.clear()
+        for item in collection.paths:
+            if item in self._path_actions:
+                app.logger.warning("%s is listed more than once in this collection.", item)
+                continue
+            count = len(self._path_actions)
+            shortcut = self._PATH_SHORTCUTS[count] if count < len(self._PATH_SHORTCUTS) else None
+            action = apputils.create_action(self._paths_menu, item, shortcut=shortcut, checked=True)
+            self._path_actions[item] = action
+        _replace_menu_actions(self._paths_menu, list(self._path_actions.values()))
+        # Icons are resolved when the paths menu is first shown
+        self._path_icons_loaded = False
 
     def shut_collection(self):
-        self._save.setEnabled(False)
-        self._save_as.setEnabled(False)
-        self._reset.setEnabled(False)
-        self._refresh.setEnabled(False)
-        self._reindex.setEnabled(False)
-        self._selective_refresh.setEnabled(False)
-        self._add_bookmark.setEnabled(False)
-        self._shut_db.setEnabled(False)
+        for action in self._collection_actions.values():
+            action.setEnabled(False)
+        self._path_actions.clear()
         _clear_menu(self._paths_menu)
         self._paths_menu.setEnabled(False)
 
     @property
     def selected_paths(self) -> list:
-        paths = []
-        for item in self._paths_menu.actions():
-            if item.isChecked():
-                paths.append(item.text())
-        return paths
+        return [path for path, action in self._path_actions.items() if action.isChecked()]
 
     def update_recents(self, recents: list):
         self._update_db_list(self._history_menu, sub_items=recents, icon_name="folder-open-recent")
@@ -313,45 +407,55 @@ class CollectionMenu(QMenu, HasCollectionDisplaySupport):
         super().__init__("&Collection", parent=parent)
 
         self._save = apputils.create_action(self, DBAction.SAVE, shortcut="Ctrl+S", icon="document-save",
-                                            tooltip="Save the exif data of all open paths to the DB",
-                                            func=self._db_event, enabled=False)
+                                            tooltip="Save the exif data of all open paths to the DB", enabled=False)
         self._save_as = apputils.create_action(self, DBAction.SAVE_AS, shortcut="Ctrl+Shift+S", icon="document-save-as",
-                                               tooltip="Save the exif data of all open paths to the DB",
-                                               func=self._db_event, enabled=False)
+                                               tooltip="Save the exif data of all open paths to the DB", enabled=False)
         self._shut_db = apputils.create_action(self, DBAction.SHUT_DB, shortcut="Ctrl+W", icon="document-close",
-                                               tooltip="Close the collection, saving it if required",
-                                               func=self._db_event, enabled=False)
+                                               tooltip="Close the collection, saving it if required", enabled=False)
         self._refresh = apputils.create_action(self, DBAction.REFRESH, shortcut="F5", icon="view-refresh",
                                                tooltip="Reload the exif data for the all the collection paths from disk",
-                                               func=self._db_event, enabled=False)
+                                               enabled=False)
         self._selective_refresh = apputils.create_action(self, DBAction.REFRESH_SELECTED, shortcut="Shift+F5",
-                                                         icon="view-refresh", func=self._selective_refresh_event,
-                                                         enabled=False,
+                                                         icon="view-refresh", enabled=False,
                                                          tooltip="Reload the exif data for the the selected "
                                                                  "collection paths from disk")
         self._reindex = apputils.create_action(self, DBAction.REINDEX_COLLECTION, shortcut=None, icon="view-refresh",
-                                               tooltip="Reindex this collection for faster searches",
-                                               func=self._db_event, enabled=False)
+                                               tooltip="Reindex this collection for faster searches", enabled=False)
         self._reset = apputils.create_action(self, DBAction.RESET, icon="view-restore",
-                                             tooltip="Reset this collection",
-                                             func=self._db_event, enabled=False)
+                                             tooltip="Reset this collection", enabled=False)
         self._add_bookmark = apputils.create_action(self, DBAction.BOOKMARK, icon="bookmark",
                                                     tooltip="Add or remove this collection from favorites",
-                                                    func=self._db_event, enabled=False)
+                                                    enabled=False)
         self._open_db = apputils.create_action(self, DBAction.OPEN_DB, shortcut="Ctrl+D",
-                                               icon="collection-open", func=self._db_event,
-                                               tooltip="Open a collection")
+                                               icon="collection-open", tooltip="Open a collection")
         self._open_private_db = apputils.create_action(self, DBAction.OPEN_PRIVATE_DB, shortcut=None,
-                                                       icon="collection-open", func=self._db_event,
+                                                       icon="collection-open",
                                                        tooltip="Open a collection which will not be recorded")
         self._open_private_db.setVisible(False)
+        self._collection_actions = {action.data(): action for action in
+                                    (self._save, self._save_as, self._shut_db, self._refresh, self._selective_refresh,
+                                     self._reindex, self._reset, self._add_bookmark)}
 
         self._paths_menu = QMenu(self._MENU_DB_PATHS, self)
-        self._paths_menu.setIcon(QIcon.fromTheme("collection-paths"))
+        self._path_actions = {}
+        self._path_icons_loaded = True
+        self._paths_menu.aboutToShow.connect(self._load_path_icons)
+        self._paths_menu.setIcon(apputils.get_themed_icon("collection-paths"))
         self._history_menu = QMenu(self._MENU_DB_HISTORY, self)
-        self._history_menu.setIcon(QIcon.fromTheme("folder-open-recent"))
+        self._history_menu.setIcon(apputils.get_themed_icon("folder-open-recent"))
         self._bookmarks_menu = QMenu(self._MENU_DB_BOOKMARKS, self)
-        self._bookmarks_menu.setIcon(QIcon.fromTheme("bookmark"))
+        self._bookmarks_menu.setIcon(apputils.get_themed_icon("bookmark"))
+        # Recents and bookmarks are only turned into actions when their menu is opened
+        self._pending_db_lists = {}
+        self._shown_db_lists = {}
+        self._history_menu.aboutToShow.connect(self._populate_history_menu)
+        self._bookmarks_menu.aboutToShow.connect(self._populate_bookmarks_menu)
+
+        # Each menu reports its own entries through a single slot
+        self.triggered.connect(self._db_event)
+        self._paths_menu.triggered.connect(self._paths_change_event)
+        self._history_menu.triggered.connect(self._open_db_event)
+        self._bookmarks_menu.triggered.connect(self._open_db_event)
 
         self._create_menu()
 
@@ -375,21 +479,61 @@ class CollectionMenu(QMenu, HasCollectionDisplaySupport):
         self.addAction(self._add_bookmark)
 
     def _update_db_list(self, menu: QMenu, sub_items: list, icon_name: str):
-        _clear_menu(menu)
-        for path in sub_items:
-            menu.addAction(apputils.create_action(self, path, func=self._open_db_event, icon=icon_name))
-
+        # A menu that already shows these entries is not rebuilt
+        if self._shown_db_lists.get(menu) == sub_items:
+            self._pending_db_lists.pop(menu, None)
+            return
+        self._pending_db_lists[menu] = (list(sub_items), icon_name)
+
+    def _populate_db_list(self, menu: QMenu):
+        if menu not in self._pending_db_lists:
+            return
+        sub_items, icon_name = self._pending_db_lists.pop(menu)
+        # These are plain entries, so the menu creates them itself
+        menu.setUpdatesEnabled(False)
+        try:
+            menu.clear()
+            for path in sub_items:
+                apputils.add_menu_action(menu, path, icon=icon_name)
+            self._shown_db_lists[menu] = sub_items
+        finally:
+            menu.setUpdatesEnabled(True)
+
+    @pyqtSlot()
+    def _populate_history_menu(self):
+        self._populate_db_list(self._history_menu)
+
+    @pyqtSlot()
+    def _populate_bookmarks_menu(self):
+        self._populate_db_list(self._bookmarks_menu)
+
+    @pyqtSlot()
+    def _load_path_icons(self):
+        if self._path_icons_loaded:
+            return
+        for path, action in self._path_actions.items():
+            icon_name = apputils.get_mime_type_icon_name(path, is_dir=os.path.isdir(path))
+            action.setIcon(apputils.get_themed_icon(icon_name))
+        self._path_icons_loaded = True
+
+    @pyqtSlot(QAction)
     def _paths_change_event(self, _):
         self.collection_event.emit(DBAction.PATH_CHANGE, self.selected_paths)
 
-    def _open_db_event(self, db_to_open):
-        self.collection_event.emit(DBAction.OPEN_DB, db_to_open)
-
-    def _db_event(self, action):
-        self.collection_event.emit(DBAction(action), None)
-
-    def _selective_refresh_event(self, _):
-        self.collection_event.emit(DBAction.REFRESH_SELECTED, self.selected_paths)
+    @pyqtSlot(QAction)
+    def _open_db_event(self, action: QAction):
+        self.collection_event.emit(DBAction.OPEN_DB, action.data())
+
+    @pyqtSlot(QAction)
+    def _db_event(self, action: QAction):
+        # Entries of the sub-menus are also reported here, they are handled by the sub-menu slots
+        db_action = action.data()
+        if not isinstance(db_action, DBAction):
+            return
+        if db_action == DBAction.REFRESH_SELECTED:
+            self.collection_event.emit(db_action, self.selected_paths)
+        else:
+            self.collection_event.emit(db_action, None)
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Control:
@@ -406,71 +550,71 @@ class HelpMenu(QMenu):
     LOG_INFO = "INFO"
     LOG_WARNING = "WARNING"
     LOG_ERROR = "ERROR"
+    _LOG_LEVELS = {LOG_DEBUG: logging.DEBUG, LOG_INFO: logging.INFO, LOG_WARNING: logging.WARNING,
+                   LOG_ERROR: logging.ERROR}
 
     def __init__(self, parent):
         super().__init__("&Help", parent)
-        self._log_menu = QMenu("Set Application Log Level", parent)
-        self._log_menu.setIcon(QIcon.fromTheme("text-x-generic"))
-        self._log_level_group = QActionGroup(self._log_menu)
-
-        self._debug = apputils.create_action(parent, self.LOG_DEBUG, self._log_level_changed,
-                                             tooltip="Display all application logs", checked=False)
-        self._info = apputils.create_action(parent, self.LOG_INFO, self._log_level_changed,
-                                            tooltip="Do not show debug logs", checked=False)
-        self._warning = apputils.create_action(parent, self.LOG_WARNING, self._log_level_changed,
-                                               tooltip="Display warnings and errors only", checked=False)
-        self._error = apputils.create_action(parent, self.LOG_ERROR, self._log_level_changed,
-                                             tooltip="Only show application errors", checked=False)
+        self._log_menu = QMenu("Set Application Log Level", self)
+        self._log_menu.setIcon(apputils.get_themed_icon("text-x-generic"))
+        # The log level options are created the first time the menu is opened
+        self._log_level_actions = {}
+        self._log_menu.aboutToShow.connect(self._create_log_level_options)
+        self._log_menu.triggered.connect(self._log_level_selected)
         self._create_menu()
 
     def _create_menu(self):
-        self._log_level_group.setExclusive(True)
-        self._log_level_group.addAction(self._debug)
-        self._log_level_group.addAction(self._info)
-        self._log_level_group.addAction(self._warning)
-        self._log_level_group.addAction(self._error)
-
-        self._log_menu.addActions([self._debug, self._info, self._warning, self._error])
         self.set_application_log_level(appsettings.get_log_level())
 
-        self.addAction(apputils.create_action(self, MediaLibAction.OPEN_GIT, self._raise_menu_event,
-                                              icon="folder-git", tooltip="Visit this project on GitHub"))
+        apputils.add_menu_action(self, MediaLibAction.OPEN_GIT, icon="folder-git",
+                                 tooltip="Visit this project on GitHub")
         self.addMenu(self._log_menu)
         self.addSeparator()
-        self.addAction(apputils.create_action(self, MediaLibAction.ABOUT, self._raise_menu_event, icon="help-about",
-                                              tooltip="About this application"))
-
-    def _raise_menu_event(self, action):
-        self.help_event.emit(MediaLibAction(action))
+        apputils.add_menu_action(self, MediaLibAction.ABOUT, icon="help-about", tooltip="About this application")
+        self.triggered.connect(self._raise_menu_event)
+
+    @pyqtSlot()
+    def _create_log_level_options(self):
+        if self._log_level_actions:
+            return
+        log_level_group = QActionGroup(self._log_menu)
+        log_level_group.setExclusive(True)
+        for name, tooltip in ((self.LOG_DEBUG, "Display all application logs"),
+                              (self.LOG_INFO, "Do not show debug logs"),
+                              (self.LOG_WARNING, "Display warnings and errors only"),
+                              (self.LOG_ERROR, "Only show application errors")):
+            action = apputils.create_action(self._log_menu, name, tooltip=tooltip, checked=False)
+            log_level_group.addAction(action)
+            self._log_level_actions[self._LOG_LEVELS[name]] = action
+        self._log_menu.addActions(list(self._log_level_actions.values()))
+        self._set_log_level_menu_option(app.logger.level)
+
+    @pyqtSlot(QAction)
+    def _raise_menu_event(self, action: QAction):
+        # Log level options are also reported here, they are handled by _log_level_changed
+        if isinstance(action.data(), MediaLibAction):
+            self.help_event.emit(action.data())
+
+    @pyqtSlot(QAction)
+    def _log_level_selected(self, action: QAction):
+        self._log_level_changed(action.data())
 
     def _log_level_changed(self, log_level):
-        match log_level:
-            case self.LOG_ERROR:
-                self.set_application_log_level(logging.ERROR)
-            case self.LOG_DEBUG:
-                self.set_application_log_level(logging.DEBUG)
-            case self.LOG_INFO:
-                self.set_application_log_level(logging.INFO)
-            case self.LOG_WARNING:
-                self.set_application_log_level(logging.WARNING)
+        self.set_application_log_level(self._LOG_LEVELS[log_level])
 
     def _set_log_level_menu_option(self, log_level):
-        match log_level:
-            case logging.DEBUG:
-                self._debug.setChecked(True)
-            case logging.INFO:
-                self._info.setChecked(True)
-            case logging.WARNING:
-                self._warning.setChecked(True)
-            case logging.ERROR:
-                self._error.setChecked(True)
+        # Levels without a menu entry leave the current selection as is
+        if log_level in self._log_level_actions:
+            self._log_level_actions[log_level].setChecked(True)
 
     def set_application_log_level(self, log_level, save_setting: bool = True):
-        app.logger.critical(f"Log level changed to {logging.getLevelName(log_level)}")
-        app.logger.setLevel(log_level)
-        if save_setting:
+        # Re-applying the current level is neither logged nor written to the settings again
+        if app.logger.level != log_level:
+            app.logger.critical("Log level changed to %s", logging.getLevelName(log_level))
+            app.logger.setLevel(log_level)
+            self._set_log_level_menu_option(log_level)
+        if save_setting and appsettings.get_log_level() != log_level:
             appsettings.set_log_level(log_level)
-        self._set_log_level_menu_option(log_level)
 
 
 class FileMenu(QMenu):
@@ -478,24 +622,21 @@ class FileMenu(QMenu):
 
     def __init__(self, parent):
         super().__init__("&File", parent)
-        self.addAction(
-            apputils.create_action(self, MediaLibAction.OPEN_FILE, shortcut="Ctrl+O", func=self._raise_menu_event,
-                                   icon="document-open", tooltip="Open a file to view its exif data"))
-        self.addAction(
-            apputils.create_action(self, MediaLibAction.OPEN_PATH, shortcut="Ctrl+D", func=self._raise_menu_event,
-                                   tooltip="Open a directory to view info of all supported files in it",
-                                   icon="document-open-folder"))
+        apputils.add_menu_action(self, MediaLibAction.OPEN_FILE, shortcut="Ctrl+O", icon="document-open",
+                                 tooltip="Open a file to view its exif data")
+        apputils.add_menu_action(self, MediaLibAction.OPEN_PATH, shortcut="Ctrl+D", icon="document-open-folder",
+                                 tooltip="Open a directory to view info of all supported files in it")
         self.addSeparator()
-        self.addAction(
-            apputils.create_action(self, MediaLibAction.SETTINGS, func=self._raise_menu_event, shortcut="Ctrl+,",
-                                   icon="preferences-system", tooltip=f"Open {app.__NAME__} Preferences"))
+        apputils.add_menu_action(self, MediaLibAction.SETTINGS, shortcut="Ctrl+,", icon="preferences-system",
+                                 tooltip=f"Open {app.__NAME__} Preferences")
         self.addSeparator()
-        self.addAction(apputils.create_action(self, MediaLibAction.APP_EXIT, func=self._raise_menu_event,
-                                              shortcut="Ctrl+Q", icon="application-exit",
-                                              tooltip=f"Quit {app.__NAME__}"))
+        apputils.add_menu_action(self, MediaLibAction.APP_EXIT, shortcut="Ctrl+Q", icon="application-exit",
+                                 tooltip=f"Quit {app.__NAME__}")
+        self.triggered.connect(self._raise_menu_event)
 
-    def _raise_menu_event(self, action):
-        self.file_event.emit(MediaLibAction(action))
+    @pyqtSlot(QAction)
+    def _raise_menu_event(self, action: QAction):
+        self.file_event.emit(action.data())
 
 
 class AppMenuBar(QMenuBar, HasCollectionDisplaySupport):
@@ -539,6 +680,6 @@ class AppMenuBar(QMenuBar, HasCollectionDisplaySupport):
     def register_plugin(self, plugin):
         pl_action = plugin.toggleViewAction()
         pl_action.setToolTip(plugin.statustip)
-        pl_action.setShortcut(plugin.shortcut)
+        pl_action.setShortcut(apputils.get_key_sequence(plugin.shortcut))
         pl_action.setIcon(plugin.icon)
         self._window_menu.addAction(pl_action)
@@ -1,8 +1,9 @@
+import json
 import logging
 import pickle
 from pathlib import Path
 
-from PyQt6.QtCore import QObject, pyqtSignal, QSettings
+from PyQt6.QtCore import QObject, pyqtSignal, QSettings, QRegularExpression
 from PyQt6.QtWidgets import QWidget, QCheckBox, QRadioButton, QGroupBox, QSplitter
 
 import app
@@ -25,6 +26,10 @@ class AppSettings(QObject):
     def __init__(self, app_name, default_settings):
         super().__init__()
         self._app_settings = QSettings(app_name, app_name)
+        # The settings file does not move once QSettings is created, so its path is resolved once
+        self._config_file = Path(self._app_settings.fileName())
+        # The UI values as they were last saved or loaded, used to skip writing values that did not change
+        self._ui_values = {}
         self._config = self._app_settings.value("app_settings")
         if self._config is None:
             self._config = default_settings
@@ -35,12 +40,10 @@ class AppSettings(QObject):
 
     @property
     def config_file(self) -> Path:
-        return Path(self._app_settings.fileName())
+        return self._config_file
 
     def get_property(self, key, default=None):
-        if self._config.__contains__(key):
-            return self._config[key]
-        return default
+        return self._config.get(key, default)
 
     def set_property(self, key, value):
         """
@@ -53,6 +56,20 @@ class AppSettings(QObject):
         self._app_settings.setValue("app_settings", self._config)
         self.settings_changed.emit(key, value)
 
+    @staticmethod
+    def _find_stateful_widgets(ui):
+        # Qt matches the names, so only the stateful widgets are wrapped as python objects
+        pattern = QRegularExpression(f"^{QRegularExpression.escape(AppSettings.stateful_prefix)}")
+        return ui.findChildren(QWidget, pattern)
+
+    def _set_ui_value(self, key, value) -> bool:
+        # An unchanged value is not set again, so the settings file is not rewritten for it
+        if key in self._ui_values and self._ui_values[key] == value:
+            return False
+        self._app_settings.setValue(key, value)
+        self._ui_values[key] = value
+        return True
+
     def save_ui(self, ui, logger=None, ignore_children=False):
         """
         https://stackoverflow.com/questions/23279125/python-pyqt4-functions-to-save-and-restore-ui-widget-values
@@ -62,29 +79,30 @@ class AppSettings(QObject):
         :return:
         """
         path = ui.objectName()
-        self._app_settings.setValue(f"{path}/geometry", ui.saveGeometry())
+        self._set_ui_value(f"{path}/geometry", ui.saveGeometry())
         if ignore_children:
             return
 
-        for obj in ui.findChildren(QWidget):
+        for obj in self._find_stateful_widgets(ui):
             name = obj.objectName()
-            if name.startswith(AppSettings.stateful_prefix):
-                value = None
-                key = f"{path}/{name}"
-                if isinstance(obj, QCheckBox):
-                    value = obj.checkState()
-                elif isinstance(obj, QRadioButton) or isinstance(obj, QGroupBox):
-                    value = obj.isChecked()
-                elif isinstance(obj, QSplitter):
-                    value = obj.saveState()
-
-                if value is not None:
-                    self._app_settings.setValue(key, value)
+            value = None
+            key = f"{path}/{name}"
+            if isinstance(obj, QCheckBox):
+                value = obj.checkState()
+            elif isinstance(obj, QRadioButton) or isinstance(obj, QGroupBox):
+                value = obj.isChecked()
+            elif isinstance(obj, QSplitter):
+                value = obj.saveState()
+
+            if value is not None:
+                if self._set_ui_value(key, value):
                     if logger is not None:
-                        logger.info(f"Saved {key}: {value}")
-                else:
-                    if logger is not None:
-                        logger.debug(f"{key} could not be saved")
+                        logger.info("Saved %s: %s", key, value)
+                elif logger is not None:
+                    logger.debug("%s is unchanged", key)
+            else:
+                if logger is not None:
+                    logger.debug("%s could not be saved", key)
 
     def load_ui(self, ui, logger=None, ignore_children=False):
         """
@@ -98,28 +116,29 @@ class AppSettings(QObject):
         geometry = self._app_settings.value(f"{path}/geometry")
         if geometry is None:
             if logger is not None:
-                logger.warn(f"{path} not found in settings")
+                logger.warning("%s not found in settings", path)
             return False
         else:
-            ui.restoreGeometry(self._app_settings.value(f"{path}/geometry"))
+            ui.restoreGeometry(geometry)
+            self._ui_values[f"{path}/geometry"] = geometry
         if ignore_children:
             return True
 
-        for obj in ui.findChildren(QWidget):
+        for obj in self._find_stateful_widgets(ui):
             name = obj.objectName()
-            if name.startswith(AppSettings.stateful_prefix):
-                key = f"{path}/{name}"
-                value = self._app_settings.value(key)
-                if logger is not None:
-                    logger.info(f"Loaded {key}: {value}")
-                if value is None:
-                    continue
-                if isinstance(obj, QCheckBox):
-                    obj.setChecked(value)
-                elif isinstance(obj, QRadioButton) or isinstance(obj, QGroupBox):
-                    obj.setChecked(bool(value))
-                elif isinstance(obj, QSplitter):
-                    obj.restoreState(value)
+            key = f"{path}/{name}"
+            value = self._app_settings.value(key)
+            if logger is not None:
+                logger.info("Loaded %s: %s", key, value)
+            if value is None:
+                continue
+            self._ui_values[key] = value
+            if isinstance(obj, QCheckBox):
+                obj.setChecked(value)
+            elif isinstance(obj, QRadioButton) or isinstance(obj, QGroupBox):
+                obj.setChecked(bool(value))
+            elif isinstance(obj, QSplitter):
+                obj.restoreState(value)
         return True
 
 
@@ -127,7 +146,7 @@ _settings = AppSettings(app.__APP_NAME__, {})
 
 
 def get_config_dir() -> Path:
-    return Path(_settings.config_dir)
+    return _settings.config_dir
 
 
 def get_recently_opened_collections():
@@ -158,25 +177,31 @@ def get_log_level():
     return _settings.get_property("log-level", logging.DEBUG)
 
 
-def push_to_list(item: str, p_list: list, max_list_size: int = get_recent_max_size()):
+def push_to_list(item: str, p_list: list, max_list_size: int = None):
+    if max_list_size is None:
+        max_list_size = get_recent_max_size()
     if item in p_list:
         p_list.remove(item)
-    if len(p_list) >= max_list_size:
-        del p_list[0]
     p_list.append(item)
+    # The oldest items are dropped in one go, the list is updated in place as callers save it afterwards
+    del p_list[:max(0, len(p_list) - max_list_size)]
     return p_list
 
 
 def _save_list(key: str, s_list: list):
-    items_pickle = pickle.dumps(s_list)
-    _settings.set_property(key, items_pickle)
+    _settings.set_property(key, json.dumps(s_list))
 
 
 def _load_list(key: str, default=None):
     if default is None:
         default = []
 
-    items_pickle = _settings.get_property(key)
-    if items_pickle:
-        return pickle.loads(items_pickle)
-    return default
+    items_json = _settings.get_property(key)
+    if not items_json:
+        return default
+    if isinstance(items_json, bytes):
+        # Lists used to be pickled, they are stored as json the first time they are read
+        s_list = pickle.loads(items_json)
+        _save_list(key, s_list)
+        return s_list
+    return json.loads(items_json)
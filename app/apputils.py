@@ -1,14 +1,20 @@
+import os
+from collections import defaultdict
 from functools import partial
 from pathlib import Path
 
 from PyQt6.QtCore import QDir, QMimeDatabase
-from PyQt6.QtGui import QAction, QIcon
+from PyQt6.QtGui import QAction, QIcon, QKeySequence
 from PyQt6.QtWidgets import QFileDialog, QMessageBox, QWidgetAction
 
 import app
 from app.collection import props
 
 _mime_database = QMimeDatabase()
+_THEME_ICON_CACHE = {}
+_KEY_SEQUENCE_CACHE = {}
+_MIME_ICON_NAME_CACHE = {}
+_MIME_TYPE_DIRECTORY = "inode/directory"
 
 
 def show_exception(parent, exception: Exception):
@@ -24,34 +30,66 @@ def get_new_paths(parent, is_dir=False, file_filter=None) -> list:
     :param file_filter: The file filter to use
     :return: Returns a list of files, or a single directory
     """
-    files = []
     if is_dir:
         path = QFileDialog.getExistingDirectory(parent, "Select Directory", str(Path.home()),
                                                 QFileDialog.Option.DontUseCustomDirectoryIcons |
                                                 QFileDialog.Option.ShowDirsOnly)
-        if path != "":
-            files.append(QDir.toNativeSeparators(path))
+        return [QDir.toNativeSeparators(path)] if path else []
+
+    if file_filter is not None:
+        app.logger.debug("Filtering for files that match the following extensions %s", file_filter)
+        resp = QFileDialog.getOpenFileNames(parent, "Select Files", str(Path.home()), filter=file_filter,
+                                            options=QFileDialog.Option.DontUseCustomDirectoryIcons)
     else:
-        if file_filter is not None:
-            app.logger.debug(f"Filtering for files that match the following extensions {file_filter}")
-            resp = QFileDialog.getOpenFileNames(parent, "Select Files", str(Path.home()), filter=file_filter,
-                                                options=QFileDialog.Option.DontUseCustomDirectoryIcons)
-        else:
-            resp = QFileDialog.getOpenFileNames(parent, "Select Files", str(Path.home()),
-                                                options=QFileDialog.Option.DontUseCustomDirectoryIcons)
-        if len(resp[0]) > 0:
-            for file in resp[0]:
-                files.append(QDir.toNativeSeparators(file))
-    return files
+        resp = QFileDialog.getOpenFileNames(parent, "Select Files", str(Path.home()),
+                                            options=QFileDialog.Option.DontUseCustomDirectoryIcons)
+    return [QDir.toNativeSeparators(file) for file in resp[0]]
+
+
+def get_mime_type_icon_name(file: str, is_dir: bool = False) -> str:
+    """
+    Returns the theme icon name for the type of a file. Only the name is used, the file is never read from disk
+    :param file: The file name or path
+    :param is_dir: Whether the file is a directory, callers that know this say so
+    :return: The icon name of the file's mime type
+    """
+    if is_dir:
+        return _mime_database.mimeTypeForName(_MIME_TYPE_DIRECTORY).iconName()
+    # Files are cached by extension, so the type is resolved from the extension alone. Patterns that match whole
+    # names, compound extensions or letter case are ignored, otherwise the first name seen would decide the icon
+    # of every later file with the same extension
+    extension = os.path.splitext(file)[1].lower()
+    if extension:
+        if extension not in _MIME_ICON_NAME_CACHE:
+            _MIME_ICON_NAME_CACHE[extension] = _mime_database.mimeTypeForFile(
+                f"file{extension}", QMimeDatabase.MatchMode.MatchExtension).iconName()
+        return _MIME_ICON_NAME_CACHE[extension]
+    return _mime_database.mimeTypeForFile(file, QMimeDatabase.MatchMode.MatchExtension).iconName()
 
 
-def get_mime_type_icon_name(file: str) -> str:
-    mime_type = _mime_database.mimeTypeForFile(file)
-    return mime_type.iconName()
+def get_themed_icon(icon_name: str) -> QIcon:
+    """
+    Returns the theme icon for the given name. Icons are looked up once and shared between callers
+    :param icon_name: The name of the icon in the current theme
+    :return: The QIcon for this name
+    """
+    if icon_name not in _THEME_ICON_CACHE:
+        _THEME_ICON_CACHE[icon_name] = QIcon.fromTheme(icon_name)
+    return _THEME_ICON_CACHE[icon_name]
 
 
-def create_action(parent, name, func=None, shortcut=None, tooltip=None, icon=None, checked=None, enabled=True,
-                  widget=None):
+def get_key_sequence(shortcut: str) -> QKeySequence:
+    """
+    Returns the key sequence for a shortcut string. Shortcuts are parsed once and shared between callers
+    :param shortcut: The shortcut, for example Ctrl+S
+    :return: The QKeySequence for this shortcut
+    """
+    if shortcut not in _KEY_SEQUENCE_CACHE:
+        _KEY_SEQUENCE_CACHE[shortcut] = QKeySequence(shortcut)
+    return _KEY_SEQUENCE_CACHE[shortcut]
+
+
+def create_action(parent, name, func=None, shortcut=None, tooltip=None, icon=None, checked=None, enabled=True):
     """
     Creates an action for use in a Toolbar or Menu
     :param parent: The actions parent
@@ -62,48 +100,93 @@ def create_action(parent, name, func=None, shortcut=None, tooltip=None, icon=Non
     :param icon: The icon to show for this action
     :param checked: Whether the visual cue associated with this action represents a check mark
     :param enabled: Whether the action is enabled once created
-    :param widget: If a widget is provided, this function will create a QWidgetAction instead of a QAction
-    :return: A QAction object representing this action
+    :return: A QAction object representing this action. The name is also stored as the action's data, so that
+    a single slot can tell menu actions apart
     """
     # TODO: Test
-    if widget is not None:
-        action = QWidgetAction(parent)
-    else:
-        action = QAction(name, parent)
+    action = QAction(name, parent)
+    action.setData(name)
 
     if tooltip and shortcut:
         tooltip = f"{tooltip} ({shortcut})"
     if shortcut:
-        action.setShortcut(shortcut)
+        action.setShortcut(get_key_sequence(shortcut))
     if tooltip:
         action.setToolTip(tooltip)
         action.setStatusTip(tooltip)
     if func:
         action.triggered.connect(partial(func, name))
     if icon:
-        action.setIcon(QIcon.fromTheme(icon))
+        action.setIcon(get_themed_icon(icon))
     if checked is not None:
         action.setCheckable(True)
         action.setChecked(checked)
-    action.setEnabled(enabled)
+    if not enabled:
+        action.setEnabled(False)
+    return action
+
+
+def create_widget_action(parent, widget, tooltip=None):
+    """
+    Creates an action that shows a widget in a Toolbar or Menu
+    :param parent: The actions parent
+    :param widget: The widget to show for this action
+    :param tooltip: The tooltip to display when this action is interacted with. The widget receives the hover
+    events, so it is not shown in the status bar
+    :return: A QWidgetAction object showing this widget
+    """
+    action = QWidgetAction(parent)
+    action.setDefaultWidget(widget)
+    if tooltip:
+        action.setToolTip(tooltip)
+    return action
+
+
+def add_menu_action(menu, name, shortcut=None, tooltip=None, icon=None):
+    """
+    Adds a plain entry to a menu. The menu creates, labels and inserts the action in a single call, so this is
+    preferred over create_action for menus that handle their entries through the menu's triggered signal
+    :param menu: The menu to add this action to
+    :param name: The action name, also stored as the action's data
+    :param shortcut: The keyboard shortcut for this action
+    :param tooltip: The tooltip to display when this action is interacted with
+    :param icon: The icon to show for this action
+    :return: The QAction that was added to the menu
+    """
+    _icon = get_themed_icon(icon) if icon else QIcon()
+    if shortcut:
+        action = menu.addAction(_icon, name, get_key_sequence(shortcut))
+        if tooltip:
+            tooltip = f"{tooltip} ({shortcut})"
+    else:
+        action = menu.addAction(_icon, name)
+    if tooltip:
+        action.setToolTip(tooltip)
+        action.setStatusTip(tooltip)
+    action.setData(name)
     return action
 
 
 def create_tag_groups(tags: list) -> dict:
-    tag_groups = {
-        props.DB_TAG_GROUP_DEFAULT: []
-    }
+    """
+    Groups the tags by their prefix
+    :param tags: The tags to group, grouped tags are of the form group:name
+    :return: A dictionary of group to names. The default group, if present, comes first in the order of the tags.
+    The other groups follow in sorted order and their names are sorted.
+    """
+    default_group = []
+    named_groups = defaultdict(list)
     for key in tags:
-        tokens = key.split(":")
-        if len(tokens) == 1:
-            tag_groups[props.DB_TAG_GROUP_DEFAULT].append(tokens[0])
-        elif len(tokens) == 2:
-            if tokens[0] not in tag_groups:
-                tag_groups[tokens[0]] = []
-            tag_groups[tokens[0]].append(tokens[1])
+        group, sep, name = key.partition(":")
+        if not sep:
+            default_group.append(group)
+        elif ":" not in name:
+            named_groups[group].append(name)
         else:
-            app.logger.warning(f"Unhandled field {key} will not be shown in the view")
-    if len(tag_groups[props.DB_TAG_GROUP_DEFAULT]) == 0:
-        # Remove this group if it's not needed
-        del tag_groups[props.DB_TAG_GROUP_DEFAULT]
+            app.logger.warning("Unhandled field %s will not be shown in the view", key)
+
+    # The default group is only added if it's needed
+    tag_groups = {props.DB_TAG_GROUP_DEFAULT: default_group} if default_group else {}
+    for group in sorted(named_groups):
+        tag_groups[group] = sorted(named_groups[group])
     return tag_groups
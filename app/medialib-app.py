@@ -6,7 +6,7 @@ from datetime import datetime
 from pathlib import Path
 
 from PyQt6.QtCore import QUrl
-from PyQt6.QtGui import QDesktopServices, QIcon
+from PyQt6.QtGui import QDesktopServices
 from PyQt6.QtWidgets import QMainWindow, QVBoxLayout, QWidget, QApplication, QMessageBox, QFileDialog
 
 import app
@@ -74,7 +74,7 @@ class MediaLibApp(QMainWindow, HasCollectionDisplaySupport):
         self.setWindowTitle(app.__APP_NAME__)
         self.setMinimumWidth(1200)
         self.setMinimumHeight(768)
-        self.setWindowIcon(QIcon.fromTheme("medialib-icon"))
+        self.setWindowIcon(apputils.get_themed_icon("medialib-icon"))
         # Present App
         self.show()
 
@@ -391,6 +391,7 @@ if __name__ == '__main__':
 
     # Prepare GUI with database if supplied
     application = QApplication(sys.argv)
+    app.configure_icon_theme()
     app.logger.debug(f"{app.__APP_NAME__} is starting up")
     medialib_app = MediaLibApp(args)
 
@@ -3,8 +3,8 @@ from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
 
-from PyQt6.QtCore import QObject, pyqtSignal, QSize
-from PyQt6.QtGui import QIcon, QMouseEvent, QFontDatabase
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QSize
+from PyQt6.QtGui import QAction, QIcon, QMouseEvent, QFontDatabase
 from PyQt6.QtWidgets import QApplication, QToolBar, QSizePolicy, QLabel, QDockWidget
 
 from app import apputils
@@ -120,15 +120,16 @@ class PluginToolBar(QToolBar):
     def __init__(self, parent: QDockWidget, title: str):
         super().__init__(parent)
         self._parent = parent
-        self._float = apputils.create_action(self, self._FLOAT, self._toolbar_event, icon="window")
-        self._close = apputils.create_action(self, self._CLOSE, self._toolbar_event, icon="dialog-close")
+        self._float = apputils.create_action(self, self._FLOAT, icon="window")
+        self._close = apputils.create_action(self, self._CLOSE, icon="dialog-close")
         self._no_action = apputils.create_action(self, "", enabled=False)
+        self.actionTriggered.connect(self._toolbar_event)
         self.setStyleSheet("QToolBar{padding: 0}")
         self._title = title
         self._init_ui()
 
     def add_button(self, button_name, icon_name=None, shortcut=None):
-        button = apputils.create_action(self, button_name, icon=icon_name, shortcut=shortcut, func=self._toolbar_event)
+        button = apputils.create_action(self, button_name, icon=icon_name, shortcut=shortcut)
         self.insertAction(self._no_action, button)
 
     def _init_ui(self):
@@ -149,7 +150,9 @@ class PluginToolBar(QToolBar):
         self.addAction(self._float)
         self.addAction(self._close)
 
-    def _toolbar_event(self, event_name):
+    @pyqtSlot(QAction)
+    def _toolbar_event(self, action: QAction):
+        event_name = action.data()
         match event_name:
             case self._FLOAT:
                 self._parent.setFloating(not self._parent.isFloating())
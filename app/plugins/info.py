@@ -49,7 +49,7 @@ class FileInfoPlugin(QDockWidget, WindowInfo, FileClickHandler):
                         self._root_prop_count += 1
 
             # Add the rest of the items
-            for group, keys in sorted(groups.items()):
+            for group, keys in groups.items():
                 if group == props.DB_TAG_GROUP_DEFAULT:
                     continue
                 if group == props.DB_TAG_GROUP_SYSTEM:
@@ -58,7 +58,7 @@ class FileInfoPlugin(QDockWidget, WindowInfo, FileClickHandler):
                 else:
                     group_node = self._get_group_item(group)
                 group_is_empty = False
-                for key in sorted(keys):
+                for key in keys:
                     field_name = f"{group}:{key}"
                     if field_name in file_data:
                         group_is_empty = group_is_empty or file_data[field_name] is None
@@ -161,7 +161,7 @@ class FileInfoPlugin(QDockWidget, WindowInfo, FileClickHandler):
 
     @property
     def icon(self) -> QIcon:
-        return QIcon.fromTheme("dialog-information")
+        return apputils.get_themed_icon("dialog-information")
 
     @property
     def shortcut(self) -> str:
@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import QDialogButtonBox, \
     QDockWidget, QCompleter, QLineEdit, QPlainTextEdit
 
 import app
+from app import apputils
 from app.collection.ds import Collection, HasCollectionDisplaySupport
 from app.plugins.framework import WindowInfo, SearchEventHandler, PluginToolBar
 
@@ -183,7 +184,7 @@ class FindWidget(QDockWidget, WindowInfo, SearchEventHandler):
 
     @property
     def icon(self) -> QIcon:
-        return QIcon.fromTheme("folder-saved-search")
+        return apputils.get_themed_icon("folder-saved-search")
 
     @property
     def shortcut(self) -> str:
@@ -244,7 +245,7 @@ class QueryWidget(QDockWidget, WindowInfo, HasCollectionDisplaySupport, SearchEv
 
     @property
     def icon(self) -> QIcon:
-        return QIcon.fromTheme("folder-saved-search")
+        return apputils.get_themed_icon("folder-saved-search")
 
     @property
     def shortcut(self) -> str:
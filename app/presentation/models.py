@@ -6,6 +6,7 @@ from PyQt6.QtCore import QAbstractItemModel, QModelIndex, Qt, QVariant, QAbstrac
 from PyQt6.QtGui import QPalette, QStandardItem, QIcon
 
 import app
+from app import apputils
 from app.collection import props
 from app.plugins.framework import FileData
 
@@ -13,24 +14,22 @@ from app.plugins.framework import FileData
 _GROUP_BG = QPalette().color(QPalette.ColorGroup.Normal, QPalette.ColorRole.Window)
 _GROUP_BG.setAlpha(8)
 
-_ICON_FOLDER = QIcon.fromTheme("folder")
+_ICON_FOLDER = "folder"
 _UNKNOWN = "N/A"
 
-_MIME_ICON_CACHE = {}
+_ICON_GENERIC = "text-x-generic"
 
 
 def get_mime_type_icon(mime_type_icon_name: str, use_fallback_icon=True):
-    if mime_type_icon_name not in _MIME_ICON_CACHE:
-        mime_icon = QIcon.fromTheme(mime_type_icon_name)
-        if mime_icon is None and use_fallback_icon:
-            # Icon was not found, so let's return a generic icon
-            app.logger.debug(f"Adding icon for {mime_type_icon_name} to cache")
-            if mime_type_icon_name == "text-x-generic":
-                app.logger.warning(f"Icon for {mime_type_icon_name} was not found, will return None")
-                return None
-            return get_mime_type_icon("text-x-generic")
-        _MIME_ICON_CACHE[mime_type_icon_name] = mime_icon
-    return _MIME_ICON_CACHE[mime_type_icon_name]
+    # Theme icons are cached by apputils, missing icons are returned as null icons
+    mime_icon = apputils.get_themed_icon(mime_type_icon_name)
+    if mime_icon.isNull() and use_fallback_icon:
+        # Icon was not found, so let's return a generic icon
+        if mime_type_icon_name == _ICON_GENERIC:
+            app.logger.warning("Icon for %s was not found, will return None", mime_type_icon_name)
+            return None
+        return get_mime_type_icon(_ICON_GENERIC)
+    return mime_icon
 
 
 @dataclass
@@ -125,22 +124,23 @@ class FileSystemModelBuilder(ModelBuilder):
         dir_map = {}
         dir_groups = self._group_by_path(kwargs["view_items"])
         for _dir in dir_groups:
-            self._add_to_dir_map(list(Path(_dir).parts), dir_map, "")
+            self._add_to_dir_map(Path(_dir).parts, dir_map)
             # At this point, the current _dir is guaranteed to exist in the tree. So add all children to it
             for item in dir_groups[_dir]:
                 dir_map[_dir].add_child(item)
         return next(iter(dir_map.values()))
 
-    def _add_to_dir_map(self, dir_components: list, dir_map: dict, parent_path: str):
-        component = dir_components.pop(0)
-        current_path = str(Path(parent_path).joinpath(component))
-        if current_path not in dir_map:
-            item = ViewItem(icon=_ICON_FOLDER, parent=None, data=None, text=component)
-            if parent_path != "":
-                dir_map[parent_path].add_child(item)
-            dir_map[current_path] = item
-        if len(dir_components) > 0:
-            self._add_to_dir_map(dir_components, dir_map, current_path)
+    @staticmethod
+    def _add_to_dir_map(dir_components: tuple, dir_map: dict):
+        parent_path = ""
+        for component in dir_components:
+            current_path = str(Path(parent_path).joinpath(component))
+            if current_path not in dir_map:
+                item = ViewItem(icon=apputils.get_themed_icon(_ICON_FOLDER), parent=None, data=None, text=component)
+                if parent_path != "":
+                    dir_map[parent_path].add_child(item)
+                dir_map[current_path] = item
+            parent_path = current_path
 
     @staticmethod
     def _group_by_path(model_data: list):
@@ -159,7 +159,7 @@ class GroupTreeItemBuilder(ModelBuilder):
         return self._build_tree("", kwargs["group_by"], kwargs["view_items"])
 
     def _build_tree(self, group_path: str, grouping: list, data: list, grouping_index: int = 0):
-        current_node = ViewItem(icon=_ICON_FOLDER, parent=None, data=None, text=group_path)
+        current_node = ViewItem(icon=apputils.get_themed_icon(_ICON_FOLDER), parent=None, data=None, text=group_path)
         if grouping_index < len(grouping):
             group = grouping[grouping_index]
             keys = {}
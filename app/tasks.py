@@ -1,5 +1,4 @@
 import datetime
-import logging
 import queue
 from dataclasses import dataclass
 from enum import StrEnum
@@ -10,18 +9,6 @@ from PyQt6.QtWidgets import QWidget, QProgressBar, QHBoxLayout
 import app
 
 
-def _create_logger(app_name: str):
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - '
-                                  '%(module)s:[%(funcName)s]:%(lineno)s - %(message)s')
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.DEBUG)
-    ch.setFormatter(formatter)
-    logger = logging.getLogger(app_name)
-    logger.addHandler(ch)
-    logger.setLevel(logging.DEBUG)
-    return logger
-
-
 class TaskStatus(StrEnum):
     STARTED = "STARTED"
     WAITING = "WAITING"
@@ -96,7 +83,7 @@ class TaskManager(QWidget):
         self._progressbar = QProgressBar()
         self._progressbar.setMinimum(0)
         self._progressbar.setMaximum(0)
-        self._logger = _create_logger(self.__class__.__name__)
+        self._logger = app.setup_logger(self.__class__.__name__)
         self._init_ui()
 
     def _init_ui(self):
@@ -4,5 +4,8 @@ import sys
 
 from PyQt6.QtWidgets import QApplication
 
+import app
+
 # App instance required for unit testing. Only one app instance should be running!
 test_app = QApplication(sys.argv)
+app.configure_icon_theme()
@@ -65,6 +65,12 @@ class QueryWidgetTester(unittest.TestCase):
         self._query_widget._toolbar_button_clicked("Clear")
         self.assertEqual(self._query_widget._query_text.toPlainText(), "")
 
+    def test_toolbar_button_triggered(self):
+        self._query_widget._query_text.setPlainText("Foo_BAR baz")
+        clear = next(a for a in self._query_widget._toolbar.actions() if a.text() == "Clear")
+        clear.trigger()
+        self.assertEqual(self._query_widget._query_text.toPlainText(), "")
+
     def test_text_retrieval(self):
         test_text = "Foo_BAR baz"
         self._query_widget._query_text.setPlainText(test_text)
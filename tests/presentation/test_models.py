@@ -1,7 +1,8 @@
 import tempfile
 import unittest
 
-from app.presentation.models import ViewItem, ModelData, BaseViewBuilder, FileSystemModelBuilder, GroupTreeItemBuilder
+from app.presentation.models import ViewItem, ModelData, BaseViewBuilder, FileSystemModelBuilder, GroupTreeItemBuilder, \
+    get_mime_type_icon
 from tests.collection import test_utils
 from pathlib import Path
 
@@ -76,6 +77,14 @@ class TestViewManagerPreprocessor(unittest.TestCase):
         self.assertFalse(self._base_view.is_file_ops_available)
 
 
+class TestMimeTypeIcon(unittest.TestCase):
+
+    def test_missing_icon_falls_back(self):
+        # The generic icon is None if the theme does not have it either
+        self.assertIs(get_mime_type_icon("text-x-generic"), get_mime_type_icon("no-such-mime-type"))
+        self.assertTrue(get_mime_type_icon("no-such-mime-type", use_fallback_icon=False).isNull())
+
+
 class TestFileSystemModelBuilder(unittest.TestCase):
 
     def setUp(self):
@@ -1,7 +1,9 @@
 import logging
 import tempfile
 import unittest
+from logging.handlers import BufferingHandler
 
+from PyQt6 import sip
 from PyQt6.QtCore import Qt, QEvent
 from PyQt6.QtGui import QAction, QKeyEvent
 from PyQt6.QtWidgets import QWidget, QWidgetAction, QDockWidget, QMenu
@@ -40,11 +42,35 @@ class TestActions(unittest.TestCase):
         self.assertTrue(i2.shortcut().isEmpty())
         self.assertIsInstance(i2, QAction)
 
+    def test_action_data(self):
+        i1 = apputils.create_action(None, MediaLibAction.ABOUT)
+        self.assertEqual(MediaLibAction.ABOUT, i1.data())
+
+    def test_add_menu_action(self):
+        menu = QMenu()
+        i1 = apputils.add_menu_action(menu, "Test3", shortcut="X", tooltip="TOOLTIP", icon="document-open")
+        self.assertEqual([i1], menu.actions())
+        self.assertEqual("Test3", i1.data())
+        self.assertEqual("TOOLTIP (X)", i1.toolTip())
+        self.assertEqual("X", i1.shortcut())
+
     def test_widget_action_creation(self):
-        # If a widget is supplied, the action returned is a widget action
-        i2 = apputils.create_action(None, "Test2", func=None, shortcut=None, tooltip="TOOLTIP",
-                                    widget=QWidget())
+        widget = QWidget()
+        i2 = apputils.create_widget_action(None, widget, tooltip="TOOLTIP")
         self.assertIsInstance(i2, QWidgetAction)
+        self.assertIs(widget, i2.defaultWidget())
+        self.assertEqual("TOOLTIP", i2.toolTip())
+        self.assertEqual("", i2.statusTip())
+
+    def test_find_action_in_sub_menu(self):
+        menu = QMenu()
+        sub_menu = menu.addMenu("Sub Menu")
+        menu.addSeparator()
+        menu.addAction("Test1")
+        nested = sub_menu.addAction("Test2")
+        self.assertIs(nested, actions._find_action("Test2", menu.actions()))
+        self.assertIs(sub_menu, actions._find_action("Sub Menu", menu.actions()).menu())
+        self.assertIsNone(actions._find_action("Test3", menu.actions()))
 
 
 class TestViewMenu(unittest.TestCase):
@@ -73,6 +99,7 @@ class TestViewMenu(unittest.TestCase):
             db = test_utils.create_test_media_db(db_path, test_paths[:1])
             db.save()
             self._view_menu.show_collection(db)
+            self._view_menu._vm_columns.aboutToShow.emit()
             # Available fields count will be different
             self.assertEqual(len(list(self._view_menu._vm_columns.actions())), 8)
             # Presets are available
@@ -85,6 +112,7 @@ class TestViewMenu(unittest.TestCase):
             db = test_utils.create_test_media_db(db_path, test_paths[1:])
             db.save()
             self._view_menu.show_collection(db)
+            self._view_menu._vm_columns.aboutToShow.emit()
             # Available fields count will be different
             self.assertEqual(len(list(self._view_menu._vm_columns.actions())), 11)
             # Presets are available
@@ -104,6 +132,83 @@ class TestViewMenu(unittest.TestCase):
             self.assertFalse(self._view_menu._vm_groupby.isEnabled())
             self.assertFalse(self._view_menu._view_fs.isChecked())
 
+    def test_view_event(self):
+        events = []
+        self._view_menu.view_event.connect(lambda event, args: events.append((event, args)))
+        self._view_menu._export.trigger()
+        self.assertEqual([(ViewContextMenuAction.EXPORT, None)], events)
+
+    def test_field_menus_built_on_show(self):
+        with tempfile.TemporaryDirectory() as db_path:
+            db = test_utils.create_test_media_db(db_path, test_utils.get_temp_files(3))
+            self._view_menu.show_collection(db)
+            self.assertIn(self._view_menu._vm_columns, self._view_menu._pending_field_menus)
+            self._view_menu._vm_columns.aboutToShow.emit()
+            self.assertNotIn(self._view_menu._vm_columns, self._view_menu._pending_field_menus)
+            self.assertIn(self._view_menu._vm_groupby, self._view_menu._pending_field_menus)
+
+    def test_preset_clicked_event(self):
+        events = []
+        self._view_menu.view_event.connect(lambda event, args: events.append((event, args)))
+        self._view_menu._all_tags = ["Key", "Group:Key1", "Group:Key2"]
+        self._view_menu._show_field_selection(self._view_menu._all_tags, self._view_menu._vm_columns,
+                                              ViewContextMenuAction.COLUMN)
+        preset = self._view_menu._vm_presets.addAction("Preset")
+        preset.setProperty(ViewContextMenu._PROP_FIELD_ID, {"Key", "Group:Key2"})
+        preset.trigger()
+        self.assertEqual([(ViewContextMenuAction.COLUMN, ["Key", "Group:Key2"])], events)
+        self.assertTrue(self._view_menu._tag_checkboxes["Key"].isChecked())
+        # Grouped checkboxes are created with the preset applied
+        self.assertNotIn("Group:Key1", self._view_menu._tag_checkboxes)
+        _find_action("Group", self._view_menu._vm_columns).menu().aboutToShow.emit()
+        self.assertFalse(self._view_menu._tag_checkboxes["Group:Key1"].isChecked())
+        self.assertTrue(self._view_menu._tag_checkboxes["Group:Key2"].isChecked())
+
+        show_all = self._view_menu._vm_presets.addAction("All")
+        show_all.setProperty(ViewContextMenu._PROP_FIELD_ID, frozenset(self._view_menu._all_tags))
+        show_all.trigger()
+        self.assertEqual((ViewContextMenuAction.COLUMN, ["Key", "Group:Key1", "Group:Key2"]), events[-1])
+        self.assertTrue(self._view_menu._tag_checkboxes["Group:Key1"].isChecked())
+
+    def test_unchanged_columns_are_not_raised(self):
+        events = []
+        self._view_menu.view_event.connect(lambda event, args: events.append((event, args)))
+        self._view_menu.set_available_fields(["Key", "Group:Key1"])
+        preset = self._view_menu._vm_presets.addAction("Preset")
+        preset.setProperty(ViewContextMenu._PROP_FIELD_ID, {"Key"})
+        preset.trigger()
+        preset.trigger()
+        self.assertEqual([(ViewContextMenuAction.COLUMN, ["Key"])], events)
+        # New data shows all the fields again, so the preset has to be re-applied
+        self._view_menu.set_available_fields(["Key", "Group:Key1"])
+        preset.trigger()
+        self.assertEqual(2, len(events))
+
+    def test_group_menu_populated_on_show(self):
+        self._view_menu._show_field_selection(["Group:Key1", "Group:Key2"], self._view_menu._vm_groupby,
+                                              ViewContextMenuAction.GROUP_BY)
+        group_menu = _find_action("Group", self._view_menu._vm_groupby).menu()
+        self.assertTrue(group_menu.isEmpty())
+        group_menu.aboutToShow.emit()
+        group_menu.aboutToShow.emit()
+        self.assertEqual(2, len(group_menu.actions()))
+
+    def test_field_groups_are_reused(self):
+        field_groups = self._view_menu._get_field_groups(["Key", "Group:Key2", "Group:Key1"])
+        self.assertEqual((["Key"], [("Group", ["Key1", "Key2"])]), field_groups)
+        self.assertIs(field_groups, self._view_menu._get_field_groups(["Key", "Group:Key2", "Group:Key1"]))
+        self.assertIsNot(field_groups, self._view_menu._get_field_groups(["Key"]))
+
+    def test_group_by_checkbox_event(self):
+        events = []
+        self._view_menu.view_event.connect(lambda event, args: events.append((event, list(args))))
+        cb = self._view_menu._create_checkbox("Key", self._view_menu._vm_groupby, "Group:Key",
+                                              ViewContextMenuAction.GROUP_BY)
+        cb.click()
+        self.assertEqual([(ViewContextMenuAction.GROUP_BY, ["Group:Key"])], events)
+        cb.click()
+        self.assertEqual((ViewContextMenuAction.GROUP_BY, []), events[-1])
+
 
 class TestHelpMenu(unittest.TestCase):
 
@@ -139,11 +244,44 @@ class TestHelpMenu(unittest.TestCase):
         self._help_menu._log_level_changed(self._help_menu.LOG_ERROR)
         self.assertEqual(logging.ERROR, app.logger.level)
 
+    def test_log_menu_owned_by_help_menu(self):
+        self.assertIs(self._help_menu, self._help_menu._log_menu.parent())
+
+    def test_log_level_action_triggered(self):
+        self._help_menu._log_menu.aboutToShow.emit()
+        self._help_menu._log_level_actions[logging.WARNING].trigger()
+        self.assertEqual(logging.WARNING, app.logger.level)
+
+    def test_help_event(self):
+        events = []
+        self._help_menu.help_event.connect(events.append)
+        _find_action(MediaLibAction.ABOUT, self._help_menu).trigger()
+        self.assertEqual([MediaLibAction.ABOUT], events)
+
     def test_set_log_level_session(self):
         self._help_menu.set_application_log_level(logging.ERROR, False)
         self.assertEqual(logging.ERROR, app.logger.level)
         self.assertEqual(self._log_level, appsettings.get_log_level())
 
+    def test_set_log_level_unchanged(self):
+        self._help_menu.set_application_log_level(logging.ERROR, False)
+        handler = BufferingHandler(capacity=8)
+        app.logger.addHandler(handler)
+        try:
+            self._help_menu.set_application_log_level(logging.ERROR, False)
+        finally:
+            app.logger.removeHandler(handler)
+        self.assertEqual([], handler.buffer)
+        self.assertEqual(logging.ERROR, app.logger.level)
+
+    def test_log_level_menu_option(self):
+        self._help_menu.set_application_log_level(logging.INFO, False)
+        self._help_menu._log_menu.aboutToShow.emit()
+        self.assertTrue(self._help_menu._log_level_actions[logging.INFO].isChecked())
+        self._help_menu.set_application_log_level(logging.DEBUG, False)
+        self.assertTrue(self._help_menu._log_level_actions[logging.DEBUG].isChecked())
+        self.assertFalse(self._help_menu._log_level_actions[logging.INFO].isChecked())
+
 
 class TestFileMenu(unittest.TestCase):
 
@@ -161,6 +299,12 @@ class TestFileMenu(unittest.TestCase):
 
         self.assertEqual(len(_actions), 6)
 
+    def test_file_event(self):
+        events = []
+        self._file_menu.file_event.connect(events.append)
+        _find_action(MediaLibAction.OPEN_PATH, self._file_menu).trigger()
+        self.assertEqual([MediaLibAction.OPEN_PATH], events)
+
     def test_find_actions(self):
         self.assertTrue(actions._find_action(MediaLibAction.OPEN_FILE, self._file_menu.actions()) is not None)
         self.assertTrue(actions._find_action(MediaLibAction.OPEN_PATH, self._file_menu.actions()) is not None)
@@ -321,6 +465,15 @@ class TestCollectionMenu(unittest.TestCase):
             self._db_menu.show_collection(db)
             self.assertEqual(self._db_menu.selected_paths, test_paths)
 
+    def test_path_icons_loaded_on_show(self):
+        with tempfile.TemporaryDirectory() as db_path:
+            test_paths = test_utils.get_temp_files(3)
+            db = test_utils.create_test_media_db(db_path, test_paths)
+            self._db_menu.show_collection(db)
+            self.assertFalse(self._db_menu._path_icons_loaded)
+            self._db_menu._paths_menu.aboutToShow.emit()
+            self.assertTrue(self._db_menu._path_icons_loaded)
+
     def test_update_recents(self):
         with tempfile.TemporaryDirectory() as db_path:
             test_paths = test_utils.get_temp_files(7)
@@ -328,8 +481,34 @@ class TestCollectionMenu(unittest.TestCase):
             self._db_menu.show_collection(db)
             self.assertEqual(len(self._db_menu._history_menu.actions()), 0)
             self._db_menu.update_recents(test_utils.get_temp_files(3))
+            self._db_menu._history_menu.aboutToShow.emit()
             self.assertEqual(len(self._db_menu._history_menu.actions()), 3)
 
+    def test_update_recents_releases_old_entries(self):
+        self._db_menu.update_recents(test_utils.get_temp_files(3))
+        self._db_menu._history_menu.aboutToShow.emit()
+        old_actions = self._db_menu._history_menu.actions()
+        self._db_menu.update_recents(test_utils.get_temp_files(2))
+        self._db_menu._history_menu.aboutToShow.emit()
+        self.assertEqual(len(self._db_menu._history_menu.actions()), 2)
+        self.assertTrue(all(sip.isdeleted(action) for action in old_actions))
+
+    def test_unchanged_recents_are_not_rebuilt(self):
+        recents = test_utils.get_temp_files(3)
+        self._db_menu.update_recents(recents)
+        self._db_menu._history_menu.aboutToShow.emit()
+        shown_actions = self._db_menu._history_menu.actions()
+        self._db_menu.update_recents(list(recents))
+        self._db_menu._history_menu.aboutToShow.emit()
+        self.assertEqual(shown_actions, self._db_menu._history_menu.actions())
+        self.assertFalse(any(sip.isdeleted(action) for action in shown_actions))
+
+    def test_recents_created_on_show(self):
+        self._db_menu.update_recents(test_utils.get_temp_files(3))
+        self.assertEqual(len(self._db_menu._history_menu.actions()), 0)
+        self._db_menu._history_menu.aboutToShow.emit()
+        self.assertEqual(len(self._db_menu._history_menu.actions()), 3)
+
     def test_update_bookmarks(self):
         with tempfile.TemporaryDirectory() as db_path:
             test_paths = test_utils.get_temp_files(5)
@@ -337,6 +516,7 @@ class TestCollectionMenu(unittest.TestCase):
             self._db_menu.show_collection(db)
             self.assertEqual(len(self._db_menu._bookmarks_menu.actions()), 0)
             self._db_menu.update_bookmarks(test_utils.get_temp_files(4))
+            self._db_menu._bookmarks_menu.aboutToShow.emit()
             self.assertEqual(len(self._db_menu._bookmarks_menu.actions()), 4)
 
     def test_path_change_event(self):
@@ -369,6 +549,7 @@ class TestCollectionMenu(unittest.TestCase):
             self.assertEqual(len(self._db_menu._history_menu.actions()), 0)
 
             self._db_menu.update_recents(hist_paths)
+            self._db_menu._history_menu.aboutToShow.emit()
             self.assertEqual(len(self._db_menu._history_menu.actions()), 3)
             self._db_menu.collection_event.connect(cb_func)
             self._db_menu._history_menu.actions()[0].trigger()
@@ -419,10 +600,12 @@ class TestAppMenuBar(unittest.TestCase):
 
     def test_update_recents(self):
         self._menu.update_recents(["1", "2", "4"])
+        self._menu._db_menu._history_menu.aboutToShow.emit()
         self.assertEqual(3, len(self._menu._db_menu._history_menu.actions()))
 
     def test_update_bookmarks(self):
         self._menu.update_bookmarks(["1", "2", "4"])
+        self._menu._db_menu._bookmarks_menu.aboutToShow.emit()
         self.assertEqual(3, len(self._menu._db_menu._bookmarks_menu.actions()))
 
     def test_show_collection(self):
@@ -0,0 +1,92 @@
+import pickle
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from PyQt6.QtWidgets import QWidget, QCheckBox, QGroupBox, QRadioButton
+
+from app import appsettings
+from app.appsettings import AppSettings
+
+
+class TestAppSettings(unittest.TestCase):
+
+    def setUp(self):
+        self._settings = AppSettings("medialib-unittest", {})
+
+    def tearDown(self):
+        self._settings._app_settings.clear()
+
+    def test_save_and_load_ui(self):
+        ui = QWidget()
+        ui.setObjectName("TestUI")
+        group = QGroupBox(ui)
+        group.setObjectName(f"{AppSettings.stateful_prefix}_group")
+        group.setCheckable(True)
+        radio = QRadioButton(group)
+        radio.setObjectName(f"{AppSettings.stateful_prefix}_radio")
+        ignored = QGroupBox(ui)
+        ignored.setObjectName("group")
+        ignored.setCheckable(True)
+        group.setChecked(False)
+        radio.setChecked(True)
+        ignored.setChecked(False)
+        self._settings.save_ui(ui)
+
+        group.setChecked(True)
+        radio.setChecked(False)
+        ignored.setChecked(True)
+        self.assertTrue(self._settings.load_ui(ui))
+        self.assertFalse(group.isChecked())
+        self.assertTrue(radio.isChecked())
+        self.assertTrue(ignored.isChecked())
+
+    def test_unchanged_ui_values_are_not_written(self):
+        self.assertTrue(self._settings._set_ui_value("TestUI/key", True))
+        self.assertFalse(self._settings._set_ui_value("TestUI/key", True))
+        self.assertTrue(self._settings._set_ui_value("TestUI/key", False))
+        self.assertFalse(self._settings._app_settings.value("TestUI/key"))
+
+        # Loaded values are the baseline for the next save
+        self._settings._ui_values.clear()
+        self._settings._set_ui_value("TestUI/geometry", QWidget().saveGeometry())
+        ui = QWidget()
+        ui.setObjectName("TestUI")
+        radio = QRadioButton(ui)
+        radio.setObjectName(f"{AppSettings.stateful_prefix}_radio")
+        self._settings._app_settings.setValue(f"TestUI/{radio.objectName()}", True)
+        self.assertTrue(self._settings.load_ui(ui))
+        self.assertFalse(self._settings._set_ui_value(f"TestUI/{radio.objectName()}", True))
+
+    def test_find_stateful_widgets(self):
+        ui = QWidget()
+        stateful = QCheckBox(ui)
+        stateful.setObjectName(f"{AppSettings.stateful_prefix}_checkbox")
+        QCheckBox(ui).setObjectName(f"checkbox{AppSettings.stateful_prefix}")
+        self.assertEqual([stateful], AppSettings._find_stateful_widgets(ui))
+
+    def test_pickled_list_is_migrated(self):
+        key = "unittest-list"
+        with patch.object(appsettings, "_settings", self._settings):
+            self.assertEqual([], appsettings._load_list(key))
+            self._settings.set_property(key, pickle.dumps(["a", "b"]))
+            self.assertEqual(["a", "b"], appsettings._load_list(key))
+            self.assertEqual('["a", "b"]', self._settings.get_property(key))
+            self.assertEqual(["a", "b"], appsettings._load_list(key))
+
+    def test_push_to_list(self):
+        items = ["a", "b", "c"]
+        self.assertIs(items, appsettings.push_to_list("b", items, 3))
+        self.assertEqual(["a", "c", "b"], items)
+        appsettings.push_to_list("d", items, 3)
+        self.assertEqual(["c", "b", "d"], items)
+        # Lists saved with a larger size are trimmed to the current one
+        self.assertEqual(["d", "e"], appsettings.push_to_list("e", items, 2))
+        self.assertEqual(appsettings.get_recent_max_size(),
+                         len(appsettings.push_to_list("z", [str(i) for i in range(20)])))
+
+    def test_config_dir(self):
+        config_dir = appsettings.get_config_dir()
+        self.assertIsInstance(config_dir, Path)
+        self.assertEqual(Path(appsettings._settings._app_settings.fileName()).parent, config_dir)
+        self.assertEqual(Path(self._settings._app_settings.fileName()), self._settings.config_file)
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 
 from app import apputils
@@ -12,6 +14,25 @@ class TestAppUtils(unittest.TestCase):
         self.assertEqual("image-png", apputils.get_mime_type_icon_name("foo.png"))
         self.assertEqual("video-mp4", apputils.get_mime_type_icon_name("foo.mp4"))
         self.assertEqual("audio-mpeg", apputils.get_mime_type_icon_name("foo.mp3"))
+        # Lookups are cached by extension, regardless of case
+        self.assertEqual("image-jpeg", apputils.get_mime_type_icon_name("bar.JPG"))
+        self.assertEqual("inode-directory", apputils.get_mime_type_icon_name(tempfile.gettempdir(), is_dir=True))
+
+    def test_mime_type_icon_name_depends_only_on_the_extension(self):
+        apputils._MIME_ICON_NAME_CACHE.clear()
+        apputils.get_mime_type_icon_name("CMakeLists.txt")
+        self.assertEqual("text-plain", apputils.get_mime_type_icon_name("notes.txt"))
+        apputils.get_mime_type_icon_name("foo.tar.gz")
+        self.assertEqual("application-gzip", apputils.get_mime_type_icon_name("bar.gz"))
+        self.assertEqual(apputils.get_mime_type_icon_name("b.c"), apputils.get_mime_type_icon_name("a.C"))
+
+    def test_mime_type_icon_name_does_not_read_the_file(self):
+        with tempfile.TemporaryDirectory() as parent:
+            directory = os.path.join(parent, "photos.jpg")
+            os.mkdir(directory)
+            # Only callers know if a name is a directory, bare names are never looked up on disk
+            self.assertEqual("image-jpeg", apputils.get_mime_type_icon_name(directory))
+            self.assertEqual("inode-directory", apputils.get_mime_type_icon_name(directory, is_dir=True))
 
     def test_create_tag_groups(self):
         tags = ["a", "b:1", "b:2", "c", "d:1", "e:1:2"]
@@ -22,3 +43,23 @@ class TestAppUtils(unittest.TestCase):
         self.assertEqual(['a', 'c'], groups[props.DB_TAG_GROUP_DEFAULT])
         self.assertEqual(['1', '2'], groups["b"])
         self.assertEqual(['1'], groups["d"])
+
+    def test_create_tag_groups_are_sorted(self):
+        tags = ["d:2", "c", "b:2", "d:1", "a", "b:1"]
+        groups = apputils.create_tag_groups(tags)
+
+        self.assertListEqual([props.DB_TAG_GROUP_DEFAULT, 'b', 'd'], list(groups.keys()))
+        self.assertEqual(['c', 'a'], groups[props.DB_TAG_GROUP_DEFAULT])
+        self.assertEqual(['1', '2'], groups["b"])
+        self.assertEqual(['1', '2'], groups["d"])
+        self.assertNotIn(props.DB_TAG_GROUP_DEFAULT, apputils.create_tag_groups(["b:1"]))
+
+    def test_themed_icon_is_cached(self):
+        icon = apputils.get_themed_icon("document-open")
+        self.assertIs(icon, apputils.get_themed_icon("document-open"))
+        self.assertIsNot(icon, apputils.get_themed_icon("document-save"))
+
+    def test_key_sequence_is_cached(self):
+        sequence = apputils.get_key_sequence("Ctrl+S")
+        self.assertEqual("Ctrl+S", sequence.toString())
+        self.assertIs(sequence, apputils.get_key_sequence("Ctrl+S"))